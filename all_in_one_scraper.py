@@ -4,6 +4,7 @@
 
 사용법:
     python3 all_in_one_scraper.py "https://example.com"
+    python3 all_in_one_scraper.py "https://a.com" "https://b.com"  # 여러 URL 병렬 처리
     python3 all_in_one_scraper.py  # URL 입력 프롬프트
 
 기능:
@@ -11,13 +12,43 @@
 """
 
 import asyncio
+import hashlib
+import io
+import json
+import os
 import sys
 import re
 import urllib.parse
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from crawlee.crawlers import PlaywrightCrawler
-from bs4 import BeautifulSoup, NavigableString, Tag
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, async_playwright
+from bs4 import BeautifulSoup, FeatureNotFound, NavigableString, Tag
+
+try:
+    import orjson  # C 기반 JSON 직렬화 (선택 의존성)
+except ImportError:
+    orjson = None
+
+JSON_WRITE_BUFFER_SIZE = 1024 * 1024  # orjson이 없을 때 json.dump에 사용할 쓰기 버퍼 (1MB)
+
+OUTPUT_DIR = Path("outputs")  # 결과 파일을 저장할 기본 폴더
+
+EXTRACT_CACHE_SIZE = 32  # 콘텐츠 추출 결과를 캐시할 최대 페이지 수
+_extract_cache = {}  # HTML 다이제스트 → (메인 영역 태그 이름, 콘텐츠 요소 튜플)
+
+
+# 보이지 않는 특수문자 - 한 번의 스캔으로 제거하도록 하나의 문자 클래스로 합침
+_RE_INVISIBLE = re.compile(
+    r'[\u200B-\u200F\uFEFF\u2060\u00AD'  # Zero width characters, BOM, soft hyphen
+    r'\u0000-\u001F\u007F-\u009F'  # Control characters
+    r'\uE000-\uF8FF'  # Private Use Area
+    r'\uFFF0-\uFFFF]'  # Specials block
+)
+_RE_SPACES = re.compile(r' +')  # 다중 공백
+_RE_UNSAFE_FILENAME = re.compile(r'[^\w\-_.]')  # 파일명에 쓸 수 없는 문자
+# 코드 블록 언어 추정용 키워드 - 소문자 사본 없이 한 번의 스캔으로 검색
+_LANG_JS_RE = re.compile(r'var|function|script|eformsign', re.IGNORECASE)
 
 
 def clean_text(text: str) -> str:
@@ -25,15 +56,9 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    # 보이지 않는 특수문자 제거
-    text = re.sub(r'[\u200B-\u200F\uFEFF\u2060\u00AD]', '', text)  # Zero width characters, BOM, soft hyphen
-    text = re.sub(r'[\u0000-\u001F\u007F-\u009F]', '', text)  # Control characters
-    text = re.sub(r'[\uE000-\uF8FF]', '', text)  # Private Use Area
-    text = re.sub(r'[\uFFF0-\uFFFF]', '', text)  # Specials block
-    
-    text = text.replace('\t', ' ')
-    text = re.sub(r' +', ' ', text)  # 다중 공백을 단일로
-    return text.strip()
+    # 보이지 않는 특수문자 제거 후 다중 공백을 단일로 (탭·개행도 제어 문자 범위에 포함되어 함께 제거됨)
+    text = _RE_INVISIBLE.sub('', text)
+    return _RE_SPACES.sub(' ', text).strip()
 
 
 def clean_code_text(text: str) -> str:
@@ -52,12 +77,12 @@ def generate_output_paths(url: str) -> tuple[str, str, str]:
     domain = parsed.netloc.replace('www.', '')
     
     # 도메인에서 특수 문자 제거
-    clean_domain = re.sub(r'[^\w\-_.]', '_', domain)
+    clean_domain = _RE_UNSAFE_FILENAME.sub('_', domain)
     
     # 경로가 있으면 마지막 부분 추가
     if parsed.path and parsed.path != '/':
         path_part = parsed.path.strip('/').split('/')[-1]
-        path_part = re.sub(r'[^\w\-_.]', '_', path_part)
+        path_part = _RE_UNSAFE_FILENAME.sub('_', path_part)
         if path_part and len(path_part) < 20:
             clean_domain += f"_{path_part}"
     
@@ -65,12 +90,20 @@ def generate_output_paths(url: str) -> tuple[str, str, str]:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M")
     base_name = f"{clean_domain}_guide_{timestamp}"
     
-    # 폴더 구조 생성
-    output_dir = Path("outputs")
-    output_dir.mkdir(exist_ok=True)
-    
-    folder_path = output_dir / base_name
-    folder_path.mkdir(exist_ok=True)
+    # 폴더 구조 생성 (outputs 폴더까지 한 번에)
+    # 이름은 도메인 + 마지막 경로 + 분 단위 시각이라 여러 URL을 처리하면 겹칠 수 있으므로,
+    # 이미 있는 폴더는 덮어쓰지 않고 _2, _3 ... 번호를 붙여 새로 만든다
+    unique_name = base_name
+    suffix = 1
+    while True:
+        folder_path = OUTPUT_DIR / unique_name
+        try:
+            folder_path.mkdir(parents=True)
+            break
+        except FileExistsError:
+            suffix += 1
+            unique_name = f"{base_name}_{suffix}"
+    base_name = unique_name
     
     markdown_path = folder_path / f"{base_name}.md"
     json_path = folder_path / f"{base_name}.json"
@@ -78,70 +111,168 @@ def generate_output_paths(url: str) -> tuple[str, str, str]:
     return str(folder_path), str(markdown_path), str(json_path)
 
 
+# 프로세스 전체에서 재사용하는 Playwright 인스턴스와 브라우저
+_playwright = None
+_browser = None
+# 브라우저 시작을 한 번으로 제한하는 락 (Python 3.9에서는 Lock이 생성 시점의 루프에 묶이므로 처음 쓸 때 생성)
+_browser_lock = None
+
+MAX_PARALLEL_PAGES = 3  # 여러 URL 스크래핑 시 동시에 여는 최대 페이지 수
+
+# 페이지 HTML 추출에 필요 없는 리소스 타입 (로딩 시간 단축을 위해 차단)
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'stylesheet', 'font', 'media'})
+
+
+def _get_browser_lock() -> asyncio.Lock:
+    """브라우저 시작·종료용 락 반환"""
+    global _browser_lock
+    
+    if _browser_lock is None:
+        _browser_lock = asyncio.Lock()
+    return _browser_lock
+
+
+async def get_browser():
+    """공유 브라우저 반환 - 첫 호출 시에만 Chromium을 실행하고 이후에는 재사용
+    
+    여러 코루틴이 동시에 처음 호출해도 락 안에서 다시 확인하므로 브라우저는 하나만 실행된다.
+    """
+    global _playwright, _browser
+    
+    if _browser is not None:
+        return _browser
+    
+    async with _get_browser_lock():
+        if _browser is None:
+            playwright = await async_playwright().start()
+            try:
+                _browser = await playwright.chromium.launch(headless=True)
+            except BaseException:
+                await playwright.stop()
+                raise
+            _playwright = playwright
+    
+    return _browser
+
+
+async def shutdown():
+    """공유 브라우저와 Playwright 종료 - 프로그램 종료 시 호출"""
+    global _playwright, _browser
+    
+    async with _get_browser_lock():
+        if _browser is not None:
+            await _browser.close()
+            _browser = None
+        
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
+
+
+async def _block_heavy_resources(route) -> None:
+    """HTML만 저장하므로 이미지/CSS/폰트/미디어 요청은 내려받지 않고 차단"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
 async def scrape_webpage_direct(url: str) -> dict:
-    """웹페이지를 직접 스크래핑하여 메모리에 반환"""
+    """웹페이지를 직접 스크래핑하여 메모리에 반환
+    
+    브라우저는 호출 간에 재사용하고, URL마다 새 컨텍스트와 페이지만 만든다.
+    """
     
     print(f"🔄 스크래핑 시작: {url}")
     
-    crawler = PlaywrightCrawler(
-        headless=True,
-        browser_type='chromium',
-        max_requests_per_crawl=1,
-    )
-
-    scraped_data = {}
-
-    @crawler.router.default_handler
-    async def handler(context):
-        nonlocal scraped_data
+    browser = await get_browser()
+    context = await browser.new_context()
+    await context.route('**/*', _block_heavy_resources)
+    
+    try:
+        page = await context.new_page()
+        await page.goto(url)
         
         print("  ⏳ 페이지 로딩 중...")
         
         # 페이지 로딩 대기
-        await context.page.wait_for_load_state('load')
-        await context.page.wait_for_load_state('domcontentloaded')
+        await page.wait_for_load_state('load')
+        await page.wait_for_load_state('domcontentloaded')
         
-        # 메인 콘텐츠 로딩 대기
+        # 메인 콘텐츠 로딩 대기 - 대부분 DOMContentLoaded 시점에 이미 존재
         try:
-            await context.page.wait_for_selector('main, .content, .document, article, .container', timeout=5000)
+            await page.wait_for_selector('main, .content, .document, article, .container', timeout=2000)
             print("  ✅ 메인 콘텐츠 발견")
-        except:
+        except PlaywrightTimeoutError:
             print("  ⚠️ 메인 콘텐츠 선택자 대기 시간 초과 (계속 진행)")
         
-        await context.page.wait_for_timeout(3000)
+        # 고정 대기 대신 네트워크가 잠잠해질 때까지만 대기 (최대 5초)
+        try:
+            await page.wait_for_load_state('networkidle', timeout=5000)
+        except PlaywrightTimeoutError:
+            pass
         
         # 전체 HTML 추출
-        full_html = await context.page.content()
-        page_title = await context.page.title()
-        
-        scraped_data = {
-            'metadata': {
-                'url': str(context.request.url),
-                'page_title': page_title,
-                'timestamp': datetime.now().isoformat(),
-                'content_length': len(full_html)
-            },
-            'raw_content': {
-                'full_html': full_html,
-            }
+        full_html = await page.content()
+        page_title = await page.title()
+    finally:
+        await context.close()
+    
+    scraped_data = {
+        'metadata': {
+            'url': url,
+            'page_title': page_title,
+            'timestamp': datetime.now().isoformat(),
+            'content_length': len(full_html)
+        },
+        'raw_content': {
+            'full_html': full_html,
         }
-        
-        print(f"  📄 HTML 크기: {len(full_html):,}자")
-        print(f"  📝 페이지 제목: {page_title}")
-
-    await crawler.run([url])
+    }
+    
+    print(f"  📄 HTML 크기: {len(full_html):,}자")
+    print(f"  📝 페이지 제목: {page_title}")
+    
     return scraped_data
 
 
+async def scrape_webpages(urls: list[str], max_parallel: int = MAX_PARALLEL_PAGES) -> list:
+    """여러 웹페이지를 하나의 브라우저에서 병렬로 스크래핑
+    
+    세마포어로 동시에 열리는 페이지 수를 제한해 페이지 로딩 대기 시간을 겹치게 한다.
+    결과는 입력 순서대로 반환하며, 실패한 URL 자리에는 발생한 예외가 들어간다.
+    """
+    semaphore = asyncio.Semaphore(max_parallel)
+    
+    async def scrape_one(url: str) -> dict:
+        async with semaphore:
+            return await scrape_webpage_direct(url)
+    
+    return await asyncio.gather(*(scrape_one(url) for url in urls), return_exceptions=True)
+
+
+def parse_html(html_content: str) -> BeautifulSoup:
+    """HTML 파싱 - C 기반 lxml 파서 우선 사용, 설치되지 않은 환경에서는 html.parser로 대체"""
+    try:
+        return BeautifulSoup(html_content, 'lxml')
+    except FeatureNotFound:
+        return BeautifulSoup(html_content, 'html.parser')
+
+
 def process_inline_elements(element):
     """문단 내 인라인 요소들을 마크다운으로 변환"""
+    # 빠른 경로: 텍스트 노드 하나만 있는 문단은 자식 순회 없이 바로 정리
+    children = element.contents
+    if len(children) == 1 and isinstance(children[0], NavigableString):
+        return clean_text(str(children[0]))
+    
     result = ""
     
-    for child in element.children:
+    for child in children:
         if isinstance(child, NavigableString):
             result += clean_text(str(child))
         elif isinstance(child, Tag):
-            tag_name = child.name.lower()
+            tag_name = child.name
             text = clean_text(child.get_text())
             
             if tag_name in ['strong', 'b']:
@@ -156,11 +287,129 @@ def process_inline_elements(element):
     return clean_text(result)
 
 
+def _emit_heading(elem, tag_name, content_items):
+    """헤딩 처리"""
+    text = clean_text(elem.get_text())
+    if text:
+        content_items.append({
+            'type': 'heading',
+            'level': int(tag_name[1]),
+            'content': text,
+            'tag': tag_name
+        })
+
+
+def _emit_table(elem, tag_name, content_items):
+    """테이블 처리"""
+    table_data = extract_table_data(elem)
+    if table_data:
+        content_items.append({
+            'type': 'table',
+            'content': table_data
+        })
+
+
+def _emit_list(elem, tag_name, content_items):
+    """리스트 처리"""
+    list_items = extract_list_items(elem)
+    if list_items:
+        content_items.append({
+            'type': 'list',
+            'content': list_items,
+            'ordered': tag_name == 'ol'
+        })
+
+
+def _emit_code(elem, tag_name, content_items):
+    """코드 블록 처리"""
+    text = clean_code_text(elem.get_text())  # 코드 전용 정리 함수 사용
+    if text and len(text) > 5:
+        # pre 안의 code는 건너뛰기
+        if tag_name == 'code' and elem.parent and elem.parent.name == 'pre':
+            return
+        
+        language = 'javascript' if _LANG_JS_RE.search(text) else 'text'
+        content_items.append({
+            'type': 'code',
+            'content': text,
+            'language': language
+        })
+
+
+def _emit_bold(elem, tag_name, content_items):
+    """Strong/Bold 텍스트 처리"""
+    text = clean_text(elem.get_text())
+    if text and len(text) > 1:
+        content_items.append({
+            'type': 'bold',
+            'content': text
+        })
+
+
+def _emit_italic(elem, tag_name, content_items):
+    """Emphasis/Italic 텍스트 처리"""
+    text = clean_text(elem.get_text())
+    if text and len(text) > 1:
+        content_items.append({
+            'type': 'italic',
+            'content': text
+        })
+
+
+def _emit_paragraph(elem, tag_name, content_items):
+    """문단 처리 (인라인 마크다운 지원)"""
+    markdown_text = process_inline_elements(elem)
+    if markdown_text and len(markdown_text) > 1:
+        content_items.append({
+            'type': 'paragraph',
+            'content': markdown_text
+        })
+
+
+# div.document가 없을 때 메인 콘텐츠 영역으로 쓸 후보 태그 (우선순위 순)
+FALLBACK_AREA_TAGS = ('main', 'article', 'body')
+
+# 태그별 처리 함수 - 처리된 요소의 자식은 순회하지 않음
+BLOCK_HANDLERS = {
+    'h1': _emit_heading,
+    'h2': _emit_heading,
+    'h3': _emit_heading,
+    'h4': _emit_heading,
+    'h5': _emit_heading,
+    'h6': _emit_heading,
+    'table': _emit_table,
+    'ul': _emit_list,
+    'ol': _emit_list,
+    'pre': _emit_code,
+    'code': _emit_code,
+    'strong': _emit_bold,
+    'b': _emit_bold,
+    'em': _emit_italic,
+    'i': _emit_italic,
+    'p': _emit_paragraph,
+}
+
+# 스킵할 요소들 - 스택에 넣지 않아 하위 트리 전체를 순회하지 않음
+SKIP_TAGS = frozenset({'script', 'style', 'noscript', 'nav', 'header', 'footer'})
+
+
 def extract_all_text_content(element):
-    """요소에서 모든 텍스트 콘텐츠를 순차적으로 추출"""
+    """요소에서 모든 텍스트 콘텐츠를 순차적으로 추출
+    
+    재귀 호출 대신 명시적 스택으로 문서 순서대로 순회한다.
+    """
     content_items = []
+    stack = [(element, 0)]
+    
+    # 루프마다 반복되는 전역/속성 조회를 지역 변수로 고정
+    pop = stack.pop
+    push_children = stack.extend
+    get_handler = BLOCK_HANDLERS.get
+    skip_tags = SKIP_TAGS
     
-    def process_element(elem, level=0):
+    while stack:
+        elem, level = pop()
+        
         if isinstance(elem, NavigableString):
             text = clean_text(str(elem))
             if text and len(text) > 2:
@@ -169,99 +418,21 @@ def extract_all_text_content(element):
                     'content': text,
                     'level': level
                 })
-                return
+            continue
         
         if isinstance(elem, Tag):
-            tag_name = elem.name.lower()
-            
-            # 헤딩 처리
-            if tag_name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                text = clean_text(elem.get_text())
-                if text:
-                    content_items.append({
-                        'type': 'heading',
-                        'level': int(tag_name[1]),
-                        'content': text,
-                        'tag': tag_name
-                    })
-                return
-            
-            # 테이블 처리
-            elif tag_name == 'table':
-                table_data = extract_table_data(elem)
-                if table_data:
-                    content_items.append({
-                        'type': 'table',
-                        'content': table_data
-                    })
-                return
-            
-            # 리스트 처리
-            elif tag_name in ['ul', 'ol']:
-                list_items = extract_list_items(elem)
-                if list_items:
-                    content_items.append({
-                        'type': 'list',
-                        'content': list_items,
-                        'ordered': tag_name == 'ol'
-                    })
-                return
+            tag_name = elem.name
             
-            # 코드 블록 처리
-            elif tag_name in ['pre', 'code']:
-                text = clean_code_text(elem.get_text())  # 코드 전용 정리 함수 사용
-                if text and len(text) > 5:
-                    # pre 안의 code는 건너뛰기
-                    if tag_name == 'code' and elem.parent and elem.parent.name == 'pre':
-                        return
-                    
-                    language = 'javascript' if any(kw in text.lower() for kw in ['var', 'function', 'script', 'eformsign']) else 'text'
-                    content_items.append({
-                        'type': 'code',
-                        'content': text,
-                        'language': language
-                    })
-                return
+            handler = get_handler(tag_name)
+            if handler:
+                handler(elem, tag_name, content_items)
+                continue
             
-            # Strong/Bold 텍스트 처리
-            elif tag_name in ['strong', 'b']:
-                text = clean_text(elem.get_text())
-                if text and len(text) > 1:
-                    content_items.append({
-                        'type': 'bold',
-                        'content': text
-                    })
-                return
-            
-            # Emphasis/Italic 텍스트 처리
-            elif tag_name in ['em', 'i']:
-                text = clean_text(elem.get_text())
-                if text and len(text) > 1:
-                    content_items.append({
-                        'type': 'italic',
-                        'content': text
-                    })
-                return
-            
-            # 문단 처리 (인라인 마크다운 지원)
-            elif tag_name == 'p':
-                markdown_text = process_inline_elements(elem)
-                if markdown_text and len(markdown_text) > 1:
-                    content_items.append({
-                        'type': 'paragraph',
-                        'content': markdown_text
-                    })
-                return
-            
-            # 스킵할 요소들
-            elif tag_name in ['script', 'style', 'nav', 'header', 'footer']:
-                return
-            
-            # 다른 모든 요소들의 자식을 재귀적으로 처리
-            for child in elem.children:
-                process_element(child, level + 1)
+            # 다른 모든 요소들의 자식은 문서 순서를 유지하도록 역순으로 스택에 추가
+            # (스킵 태그는 꺼낸 뒤 버리지 않고 처음부터 넣지 않음, 텍스트 노드의 name은 None)
+            child_level = level + 1
+            push_children((child, child_level) for child in reversed(elem.contents) if child.name not in skip_tags)
     
-    process_element(element)
     return content_items
 
 
@@ -270,15 +441,24 @@ def extract_table_data(table_element):
     rows = []
     headers = []
     
+    # 셀마다 clean_text를 호출하지 않도록 정리 로직을 지역 변수로 묶어 인라인 처리
+    strip_invisible = _RE_INVISIBLE.sub
+    collapse_spaces = _RE_SPACES.sub
+    
     # 모든 행 찾기
     all_rows = table_element.find_all('tr')
     
     for i, row in enumerate(all_rows):
-        cells = row.find_all(['th', 'td'])
+        # 셀은 행의 직계 자식만 확인 (하위 트리 전체 재탐색 방지)
+        cells = row.find_all(['th', 'td'], recursive=False)
         if cells:
-            cell_texts = [clean_text(cell.get_text()) for cell in cells]
+            # clean_text와 동일한 정리
+            cell_texts = [
+                collapse_spaces(' ', strip_invisible('', cell.get_text())).strip()
+                for cell in cells
+            ]
             if any(cell for cell in cell_texts):  # 빈 행이 아닌 경우
-                if i == 0 and row.find('th'):  # 첫 번째 행이 헤더인 경우
+                if i == 0 and any(cell.name == 'th' for cell in cells):  # 첫 번째 행이 헤더인 경우
                     headers = cell_texts
                 else:
                     rows.append(cell_texts)
@@ -299,159 +479,236 @@ def extract_list_items(list_element):
     return items if items else None
 
 
-def convert_to_markdown(scraped_data: dict) -> str:
-    """스크래핑된 데이터를 마크다운으로 변환"""
+def find_main_area(soup):
+    """메인 콘텐츠 영역 찾기 - 우선순위: div.document > main > article > body
+    
+    대부분의 페이지에 있는 div.document는 첫 일치에서 멈추는 find로 먼저 찾고,
+    없을 때만 나머지 후보를 한 번의 순회로 모은다.
+    """
+    document = soup.find('div', class_='document')
+    if document is not None:
+        return document
+    
+    candidates = {}
+    for tag in soup.find_all(FALLBACK_AREA_TAGS):
+        candidates.setdefault(tag.name, tag)
+    
+    for name in FALLBACK_AREA_TAGS:
+        if name in candidates:
+            return candidates[name]
+    return None
+
+
+def extract_page_content(html_content: str):
+    """HTML에서 메인 콘텐츠 영역을 찾아 콘텐츠 요소 추출
     
-    print("🔄 마크다운 변환 중...")
+    같은 페이지를 다시 변환할 때 파싱과 추출을 건너뛰도록 HTML의 blake2b
+    다이제스트를 키로 결과를 캐시한다. 캐시에는 HTML 원문을 보관하지 않는다.
+    
+    Returns:
+        (메인 영역 태그 이름, 콘텐츠 요소 튜플), 메인 영역이 없으면 None
+    """
+    key = hashlib.blake2b(html_content.encode('utf-8'), digest_size=16).hexdigest()
     
-    # HTML 파싱
-    html_content = scraped_data['raw_content']['full_html']
-    soup = BeautifulSoup(html_content, 'html.parser')
+    if key in _extract_cache:
+        # 최근 사용한 항목이 가장 뒤에 오도록 다시 삽입
+        _extract_cache[key] = _extract_cache.pop(key)
+        return _extract_cache[key]
+    
+    soup = parse_html(html_content)
     
     # 메인 콘텐츠 영역 찾기
-    main_area = soup.find('div', class_='document') or soup.find('main') or soup.find('article') or soup.find('body')
+    main_area = find_main_area(soup)
     
     if not main_area:
+        return None
+    
+    result = (main_area.name, tuple(extract_all_text_content(main_area)))
+    
+    _extract_cache[key] = result
+    if len(_extract_cache) > EXTRACT_CACHE_SIZE:
+        # 가장 오래 사용하지 않은 항목 제거
+        del _extract_cache[next(iter(_extract_cache))]
+    
+    return result
+
+
+def convert_to_markdown(scraped_data: dict) -> str:
+    """스크래핑된 데이터를 마크다운으로 변환"""
+    
+    print("🔄 마크다운 변환 중...")
+    
+    # HTML 파싱 및 콘텐츠 추출 (같은 HTML은 캐시된 결과 재사용)
+    extracted = extract_page_content(scraped_data['raw_content']['full_html'])
+    
+    if not extracted:
         print("❌ 메인 콘텐츠 영역을 찾을 수 없습니다.")
         return ""
     
-    print(f"✅ 메인 영역 발견: {main_area.name}")
-    
-    # 콘텐츠 추출
-    content_items = extract_all_text_content(main_area)
+    main_area_name, content_items = extracted
+    print(f"✅ 메인 영역 발견: {main_area_name}")
     print(f"📊 {len(content_items)}개 요소 추출 완료")
     
-    # 마크다운 생성
-    markdown_lines = []
+    # 마크다운 생성 - 줄 리스트 대신 StringIO 버퍼에 바로 기록
+    buf = io.StringIO()
+    w = buf.write
     metadata = scraped_data['metadata']
     
+    # 생성 시각은 한 번만 구해 헤더와 푸터에서 함께 사용
+    now = datetime.now()
+    
     # 문서 헤더
     title = metadata['page_title'] or "웹페이지 가이드"
-    markdown_lines.extend([
-        f"# {title}",
-        "",
-        f"> **자동 생성된 가이드 문서**",
-        "",
-        f"**출처**: {metadata['url']}",
-        f"**제목**: {metadata['page_title']}",
-        f"**생성일**: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-        "",
-        "---",
-        ""
-    ])
-    
-    # 콘텐츠 변환
+    w(f"# {title}\n"
+      "\n"
+      "> **자동 생성된 가이드 문서**\n"
+      "\n"
+      f"**출처**: {metadata['url']}\n"
+      f"**제목**: {metadata['page_title']}\n"
+      f"**생성일**: {now.strftime('%Y-%m-%d %H:%M')}\n"
+      "\n"
+      "---\n"
+      "\n")
+    
+    # 콘텐츠 변환 - 유형별 개수도 같은 순회에서 집계
+    type_counts = Counter()
     for item in content_items:
         item_type = item['type']
+        type_counts[item_type] += 1
         
         if item_type == 'heading':
-            level = item['level']
-            content = item['content']
-            prefix = '#' * level
-            markdown_lines.extend([
-                f"{prefix} {content}",
-                ""
-            ])
+            prefix = '#' * item['level']
+            w(f"{prefix} {item['content']}\n\n")
         
         elif item_type == 'paragraph' or item_type == 'text':
-            markdown_lines.extend([
-                item['content'],
-                ""
-            ])
+            w(item['content'])
+            w("\n\n")
         
         elif item_type == 'code':
             language = item.get('language', 'text')
-            markdown_lines.extend([
-                f"```{language}",
-                item['content'],
-                "```",
-                ""
-            ])
+            w(f"```{language}\n")
+            w(item['content'])
+            w("\n```\n\n")
         
         elif item_type == 'table':
             table_data = item['content']
+            headers = table_data['headers']
             
-            # 헤더가 있으면 헤더부터
-            if table_data['headers']:
-                header_row = '| ' + ' | '.join(table_data['headers']) + ' |'
-                separator = '|' + '---|' * len(table_data['headers'])
-                markdown_lines.extend([header_row, separator])
+            # 헤더가 있으면 헤더부터 - 표 전체를 한 덩어리로 만들어 한 번에 기록
+            table_lines = ['| ' + ' | '.join(headers) + ' |', '|' + '---|' * len(headers)] if headers else []
             
             # 데이터 행들
-            for row in table_data['rows']:
-                if row:
-                    row_text = '| ' + ' | '.join(str(cell) for cell in row) + ' |'
-                    markdown_lines.append(row_text)
+            table_lines.extend('| ' + ' | '.join(map(str, row)) + ' |' for row in table_data['rows'] if row)
+            table_lines.append("")
             
-            markdown_lines.append("")
+            w('\n'.join(table_lines) + '\n')
         
         elif item_type == 'bold':
-            markdown_lines.extend([
-                f"**{item['content']}**",
-                ""
-            ])
+            w(f"**{item['content']}**\n\n")
         
         elif item_type == 'italic':
-            markdown_lines.extend([
-                f"*{item['content']}*",
-                ""
-            ])
+            w(f"*{item['content']}*\n\n")
         
         elif item_type == 'list':
             items = item['content']
-            ordered = item.get('ordered', False)
             
-            for i, list_item in enumerate(items, 1):
-                if ordered:
-                    markdown_lines.append(f"{i}. {list_item}")
-                else:
-                    markdown_lines.append(f"- {list_item}")
+            # 리스트 전체를 한 덩어리로 만들어 한 번에 기록
+            if item.get('ordered', False):
+                list_lines = [f"{i}. {list_item}\n" for i, list_item in enumerate(items, 1)]
+            else:
+                list_lines = [f"- {list_item}\n" for list_item in items]
+            list_lines.append("\n")
             
-            markdown_lines.append("")
+            w(''.join(list_lines))
     
     # 통계 정보
-    type_counts = {}
-    for item in content_items:
-        t = item['type']
-        type_counts[t] = type_counts.get(t, 0) + 1
-    
-    markdown_lines.extend([
-        "---",
-        "",
-        "## 📊 문서 정보",
-        "",
-        f"- **추출된 총 요소**: {len(content_items)}개",
-        f"- **헤딩**: {type_counts.get('heading', 0)}개",
-        f"- **문단**: {type_counts.get('paragraph', 0) + type_counts.get('text', 0)}개",
-        f"- **코드 블록**: {type_counts.get('code', 0)}개",
-        f"- **테이블**: {type_counts.get('table', 0)}개",
-        f"- **리스트**: {type_counts.get('list', 0)}개",
-        "",
-        "**✅ 자동 생성 완료**: 웹페이지를 완전히 마크다운으로 변환했습니다.",
-        "",
-        f"*생성 도구: all_in_one_scraper.py*",
-        f"*생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*"
-    ])
-    
-    return '\n'.join(markdown_lines)
+    w("---\n"
+      "\n"
+      "## 📊 문서 정보\n"
+      "\n"
+      f"- **추출된 총 요소**: {len(content_items)}개\n"
+      f"- **헤딩**: {type_counts['heading']}개\n"
+      f"- **문단**: {type_counts['paragraph'] + type_counts['text']}개\n"
+      f"- **코드 블록**: {type_counts['code']}개\n"
+      f"- **테이블**: {type_counts['table']}개\n"
+      f"- **리스트**: {type_counts['list']}개\n"
+      "\n"
+      "**✅ 자동 생성 완료**: 웹페이지를 완전히 마크다운으로 변환했습니다.\n"
+      "\n"
+      "*생성 도구: all_in_one_scraper.py*\n"
+      f"*생성 시간: {now.strftime('%Y-%m-%d %H:%M:%S')}*")
+    
+    return buf.getvalue()
+
+
+def write_json(json_path: str, scraped_data: dict) -> int:
+    """스크래핑 데이터를 JSON 파일로 저장 - 수백 KB의 HTML이 들어 있으므로 들여쓰기 없이 기록
+    
+    기록한 바이트 수를 반환한다.
+    """
+    if orjson is not None:
+        return Path(json_path).write_bytes(orjson.dumps(scraped_data))
+    
+    with open(json_path, 'w', encoding='utf-8', buffering=JSON_WRITE_BUFFER_SIZE) as f:
+        json.dump(scraped_data, f, ensure_ascii=False)
+        f.flush()
+        return os.fstat(f.fileno()).st_size
+
+
+async def save_result(url: str, scraped_data: dict) -> None:
+    """스크래핑 결과를 마크다운으로 변환하고 파일로 저장
+    
+    파일 쓰기는 이벤트 루프를 막지 않도록 별도 스레드에서 동시에 수행한다.
+    """
+    
+    # 2단계: 마크다운 변환
+    markdown_content = convert_to_markdown(scraped_data)
+    
+    if not markdown_content:
+        print("❌ 마크다운 변환 실패")
+        return
+    
+    print("✅ 마크다운 변환 완료")
+    
+    # 3단계: 파일 저장
+    folder_path, markdown_path, json_path = generate_output_paths(url)
+    
+    # 마크다운 / JSON 파일 저장 - 마크다운은 한 번에 UTF-8로 인코딩해 바이트로 기록
+    markdown_bytes = markdown_content.encode('utf-8')
+    md_size, json_size = await asyncio.gather(
+        asyncio.to_thread(Path(markdown_path).write_bytes, markdown_bytes),
+        asyncio.to_thread(write_json, json_path, scraped_data),
+    )
+    
+    # 파일 정보 수집 - 기록한 바이트 수를 그대로 사용하고 줄 수는 개행 개수로 계산
+    line_count = markdown_content.count('\n') + 1
+    
+    print("=" * 60)
+    print("🎉 변환 완료!")
+    print(f"📁 출력 폴더: {folder_path}")
+    print(f"📄 마크다운: {Path(markdown_path).name} ({md_size:,} bytes)")
+    print(f"📋 JSON 데이터: {Path(json_path).name} ({json_size:,} bytes)")
+    print(f"📊 줄 수: {line_count:,}")
+    print(f"🔗 원본 URL: {url}")
+    print("=" * 60)
 
 
 async def main():
     """메인 함수"""
     
-    # URL 입력 받기
+    # URL 입력 받기 - 인자로 여러 URL을 주면 병렬로 스크래핑
     if len(sys.argv) > 1:
-        url = sys.argv[1]
+        urls = sys.argv[1:]
     else:
-        url = input("🔗 스크래핑할 URL을 입력하세요: ").strip()
+        urls = [input("🔗 스크래핑할 URL을 입력하세요: ").strip()]
     
-    if not url:
+    urls = [url for url in urls if url]
+    if not urls:
         print("❌ URL이 입력되지 않았습니다.")
         return
     
     # URL 유효성 검사
-    if not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
+    urls = [url if url.startswith(('http://', 'https://')) else 'https://' + url for url in urls]
     
     try:
         print("=" * 60)
@@ -459,53 +716,24 @@ async def main():
         print("=" * 60)
         
         # 1단계: 스크래핑
-        scraped_data = await scrape_webpage_direct(url)
-        
-        if not scraped_data:
-            print("❌ 스크래핑 실패")
-            return
-        
-        print("✅ 스크래핑 완료")
-        
-        # 2단계: 마크다운 변환
-        markdown_content = convert_to_markdown(scraped_data)
-        
-        if not markdown_content:
-            print("❌ 마크다운 변환 실패")
-            return
+        results = await scrape_webpages(urls)
         
-        print("✅ 마크다운 변환 완료")
-        
-        # 3단계: 파일 저장
-        folder_path, markdown_path, json_path = generate_output_paths(url)
-        
-        # 마크다운 파일 저장
-        with open(markdown_path, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
-        
-        # JSON 파일 저장
-        import json
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(scraped_data, f, ensure_ascii=False, indent=2)
-        
-        # 파일 정보 수집
-        md_size = Path(markdown_path).stat().st_size
-        json_size = Path(json_path).stat().st_size
-        line_count = len(markdown_content.split('\n'))
-        
-        print("=" * 60)
-        print("🎉 변환 완료!")
-        print(f"📁 출력 폴더: {folder_path}")
-        print(f"📄 마크다운: {Path(markdown_path).name} ({md_size:,} bytes)")
-        print(f"📋 JSON 데이터: {Path(json_path).name} ({json_size:,} bytes)")
-        print(f"📊 줄 수: {line_count:,}")
-        print(f"🔗 원본 URL: {url}")
-        print("=" * 60)
+        for url, scraped_data in zip(urls, results):
+            if isinstance(scraped_data, Exception) or not scraped_data:
+                print(f"❌ 스크래핑 실패: {url}")
+                if isinstance(scraped_data, Exception):
+                    print(f"   {scraped_data}")
+                continue
+            
+            print(f"✅ 스크래핑 완료: {url}")
+            await save_result(url, scraped_data)
         
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        await shutdown()
 
 
 if __name__ == "__main__":
@@ -5,10 +5,25 @@
 """
 
 import json
+import logging
 import re
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from bs4 import BeautifulSoup, NavigableString, Tag
+from bs4 import BeautifulSoup, FeatureNotFound, NavigableString, Tag
+
+try:
+    import orjson  # C 기반 JSON 파싱 (선택 의존성)
+except ImportError:
+    orjson = None
+
+# 요소별 추출 진단 메시지는 DEBUG 레벨로만 출력 (기본 설정에서는 기록되지 않음)
+logger = logging.getLogger(__name__)
+
+
+_RE_SPACES = re.compile(r' +')  # 다중 공백
+# 코드 블록 언어 추정용 키워드 - 소문자 사본 없이 한 번의 스캔으로 검색
+_LANG_JS_RE = re.compile(r'var|function|script|eformsign', re.IGNORECASE)
 
 
 def clean_text(text: str) -> str:
@@ -17,15 +32,118 @@ def clean_text(text: str) -> str:
         return ""
     # 기본 정리만 수행
     text = text.replace('\t', ' ')
-    text = re.sub(r' +', ' ', text)  # 다중 공백을 단일로
-    return text.strip()
+    return _RE_SPACES.sub(' ', text).strip()
+
+
+def parse_html(html_content: str) -> BeautifulSoup:
+    """HTML 파싱 - C 기반 lxml 파서 우선 사용, 설치되지 않은 환경에서는 html.parser로 대체"""
+    try:
+        return BeautifulSoup(html_content, 'lxml')
+    except FeatureNotFound:
+        return BeautifulSoup(html_content, 'html.parser')
+
+
+def _emit_heading(elem, tag_name, content_items):
+    """헤딩 처리"""
+    text = clean_text(elem.get_text())
+    if text:
+        content_items.append({
+            'type': 'heading',
+            'level': int(tag_name[1]),
+            'content': text,
+            'tag': tag_name
+        })
+        logger.debug('  📋 %s: %s...', tag_name.upper(), text[:50])
+
+
+def _emit_table(elem, tag_name, content_items):
+    """테이블 처리"""
+    table_data = extract_table_data(elem)
+    if table_data:
+        content_items.append({
+            'type': 'table',
+            'content': table_data
+        })
+        logger.debug('  📊 테이블: %d행', len(table_data['rows']))
+
+
+def _emit_list(elem, tag_name, content_items):
+    """리스트 처리"""
+    list_items = extract_list_items(elem)
+    if list_items:
+        content_items.append({
+            'type': 'list',
+            'content': list_items,
+            'ordered': tag_name == 'ol'
+        })
+        logger.debug('  📝 리스트: %d개 항목', len(list_items))
+
+
+def _emit_code(elem, tag_name, content_items):
+    """코드 블록 처리"""
+    text = clean_text(elem.get_text())
+    if text and len(text) > 5:
+        # pre 안의 code는 건너뛰기
+        if tag_name == 'code' and elem.parent and elem.parent.name == 'pre':
+            return
+        
+        language = 'javascript' if _LANG_JS_RE.search(text) else 'text'
+        content_items.append({
+            'type': 'code',
+            'content': text,
+            'language': language
+        })
+        logger.debug('  💻 코드 (%s): %s...', language, text[:30])
+
+
+def _emit_paragraph(elem, tag_name, content_items):
+    """문단 처리 - 더 정확하게"""
+    text = clean_text(elem.get_text())
+    if text and len(text) > 1:  # 매우 관대한 길이 제한
+        content_items.append({
+            'type': 'paragraph',
+            'content': text
+        })
+        logger.debug('  📄 문단: %s...', text[:40])
+
+
+# 태그별 처리 함수 - 처리된 요소의 자식은 순회하지 않음
+BLOCK_HANDLERS = {
+    'h1': _emit_heading,
+    'h2': _emit_heading,
+    'h3': _emit_heading,
+    'h4': _emit_heading,
+    'h5': _emit_heading,
+    'h6': _emit_heading,
+    'table': _emit_table,
+    'ul': _emit_list,
+    'ol': _emit_list,
+    'pre': _emit_code,
+    'code': _emit_code,
+    'p': _emit_paragraph,
+}
+
+# 스킵할 요소들 - 스택에 넣지 않아 하위 트리 전체를 순회하지 않음
+SKIP_TAGS = frozenset({'script', 'style', 'noscript', 'nav', 'header', 'footer'})
 
 
 def extract_all_text_content(element):
-    """요소에서 모든 텍스트 콘텐츠를 순차적으로 추출"""
+    """요소에서 모든 텍스트 콘텐츠를 순차적으로 추출
+    
+    재귀 호출 대신 명시적 스택으로 문서 순서대로 순회한다.
+    """
     content_items = []
+    stack = [(element, 0)]
     
-    def process_element(elem, level=0):
+    # 루프마다 반복되는 전역/속성 조회를 지역 변수로 고정
+    pop = stack.pop
+    push_children = stack.extend
+    get_handler = BLOCK_HANDLERS.get
+    skip_tags = SKIP_TAGS
+    
+    while stack:
+        elem, level = pop()
+        
         if isinstance(elem, NavigableString):
             text = clean_text(str(elem))
             if text and len(text) > 2:
@@ -34,84 +152,21 @@ def extract_all_text_content(element):
                     'content': text,
                     'level': level
                 })
-                return
+            continue
         
         if isinstance(elem, Tag):
-            tag_name = elem.name.lower()
-            
-            # 헤딩 처리
-            if tag_name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                text = clean_text(elem.get_text())
-                if text:
-                    content_items.append({
-                        'type': 'heading',
-                        'level': int(tag_name[1]),
-                        'content': text,
-                        'tag': tag_name
-                    })
-                    print(f"  📋 {tag_name.upper()}: {text[:50]}...")
-                return
-            
-            # 테이블 처리
-            elif tag_name == 'table':
-                table_data = extract_table_data(elem)
-                if table_data:
-                    content_items.append({
-                        'type': 'table',
-                        'content': table_data
-                    })
-                    print(f"  📊 테이블: {len(table_data['rows'])}행")
-                return
+            tag_name = elem.name
             
-            # 리스트 처리
-            elif tag_name in ['ul', 'ol']:
-                list_items = extract_list_items(elem)
-                if list_items:
-                    content_items.append({
-                        'type': 'list',
-                        'content': list_items,
-                        'ordered': tag_name == 'ol'
-                    })
-                    print(f"  📝 리스트: {len(list_items)}개 항목")
-                return
+            handler = get_handler(tag_name)
+            if handler:
+                handler(elem, tag_name, content_items)
+                continue
             
-            # 코드 블록 처리
-            elif tag_name in ['pre', 'code']:
-                text = clean_text(elem.get_text())
-                if text and len(text) > 5:
-                    # pre 안의 code는 건너뛰기
-                    if tag_name == 'code' and elem.parent and elem.parent.name == 'pre':
-                        return
-                    
-                    language = 'javascript' if any(kw in text.lower() for kw in ['var', 'function', 'script', 'eformsign']) else 'text'
-                    content_items.append({
-                        'type': 'code',
-                        'content': text,
-                        'language': language
-                    })
-                    print(f"  💻 코드 ({language}): {text[:30]}...")
-                return
-            
-            # 문단 처리 - 더 정확하게
-            elif tag_name == 'p':
-                text = clean_text(elem.get_text())
-                if text and len(text) > 1:  # 매우 관대한 길이 제한
-                    content_items.append({
-                        'type': 'paragraph',
-                        'content': text
-                    })
-                    print(f"  📄 문단: {text[:40]}...")
-                return
-            
-            # 스킵할 요소들
-            elif tag_name in ['script', 'style', 'nav', 'header', 'footer']:
-                return
-            
-            # 다른 모든 요소들의 자식을 재귀적으로 처리
-            for child in elem.children:
-                process_element(child, level + 1)
+            # 다른 모든 요소들의 자식은 문서 순서를 유지하도록 역순으로 스택에 추가
+            # (스킵 태그는 꺼낸 뒤 버리지 않고 처음부터 넣지 않음, 텍스트 노드의 name은 None)
+            child_level = level + 1
+            push_children((child, child_level) for child in reversed(elem.contents) if child.name not in skip_tags)
     
-    process_element(element)
     return content_items
 
 
@@ -124,11 +179,12 @@ def extract_table_data(table_element):
     all_rows = table_element.find_all('tr')
     
     for i, row in enumerate(all_rows):
-        cells = row.find_all(['th', 'td'])
+        # 셀은 행의 직계 자식만 확인 (하위 트리 전체 재탐색 방지)
+        cells = row.find_all(['th', 'td'], recursive=False)
         if cells:
             cell_texts = [clean_text(cell.get_text()) for cell in cells]
             if any(cell for cell in cell_texts):  # 빈 행이 아닌 경우
-                if i == 0 and row.find('th'):  # 첫 번째 행이 헤더인 경우
+                if i == 0 and any(cell.name == 'th' for cell in cells):  # 첫 번째 행이 헤더인 경우
                     headers = cell_texts
                 else:
                     rows.append(cell_texts)
@@ -153,6 +209,9 @@ def convert_to_markdown(content_items, metadata):
     """추출된 콘텐츠를 마크다운으로 변환"""
     markdown_lines = []
     
+    # 생성 시각은 한 번만 구해 헤더와 푸터에서 함께 사용
+    now = datetime.now()
+    
     # 문서 헤더
     markdown_lines.extend([
         "# eformsign 기능 임베딩하기",
@@ -161,15 +220,17 @@ def convert_to_markdown(content_items, metadata):
         "",
         f"**출처**: {metadata['url']}",
         f"**제목**: {metadata['page_title']}",
-        f"**생성일**: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+        f"**생성일**: {now.strftime('%Y-%m-%d %H:%M')}",
         "",
         "---",
         ""
     ])
     
-    # 콘텐츠 순차적 변환
+    # 콘텐츠 순차적 변환 - 유형별 개수도 같은 순회에서 집계
+    type_counts = Counter()
     for item in content_items:
         item_type = item['type']
+        type_counts[item_type] += 1
         
         if item_type == 'heading':
             level = item['level']
@@ -197,54 +258,43 @@ def convert_to_markdown(content_items, metadata):
         
         elif item_type == 'table':
             table_data = item['content']
+            headers = table_data['headers']
             
-            # 헤더가 있으면 헤더부터
-            if table_data['headers']:
-                header_row = '| ' + ' | '.join(table_data['headers']) + ' |'
-                separator = '|' + '---|' * len(table_data['headers'])
-                markdown_lines.extend([header_row, separator])
+            # 헤더가 있으면 헤더부터 - 표 전체를 만든 뒤 한 번의 extend로 추가
+            header_lines = ['| ' + ' | '.join(headers) + ' |', '|' + '---|' * len(headers)] if headers else []
             
             # 데이터 행들
-            for row in table_data['rows']:
-                if row:
-                    row_text = '| ' + ' | '.join(str(cell) for cell in row) + ' |'
-                    markdown_lines.append(row_text)
+            body_lines = ['| ' + ' | '.join(map(str, row)) + ' |' for row in table_data['rows'] if row]
             
-            markdown_lines.append("")
+            markdown_lines.extend([*header_lines, *body_lines, ""])
         
         elif item_type == 'list':
             items = item['content']
-            ordered = item.get('ordered', False)
             
-            for i, list_item in enumerate(items, 1):
-                if ordered:
-                    markdown_lines.append(f"{i}. {list_item}")
-                else:
-                    markdown_lines.append(f"- {list_item}")
+            # 리스트 전체를 만든 뒤 한 번의 extend로 추가
+            if item.get('ordered', False):
+                markdown_lines.extend([f"{i}. {list_item}" for i, list_item in enumerate(items, 1)])
+            else:
+                markdown_lines.extend([f"- {list_item}" for list_item in items])
             
             markdown_lines.append("")
     
     # 통계 정보
-    type_counts = {}
-    for item in content_items:
-        t = item['type']
-        type_counts[t] = type_counts.get(t, 0) + 1
-    
     markdown_lines.extend([
         "---",
         "",
         "## 📊 문서 통계",
         "",
         f"- **추출된 총 요소**: {len(content_items)}개",
-        f"- **헤딩**: {type_counts.get('heading', 0)}개",
-        f"- **문단**: {type_counts.get('paragraph', 0) + type_counts.get('text', 0)}개",
-        f"- **코드 블록**: {type_counts.get('code', 0)}개",
-        f"- **테이블**: {type_counts.get('table', 0)}개",
-        f"- **리스트**: {type_counts.get('list', 0)}개",
+        f"- **헤딩**: {type_counts['heading']}개",
+        f"- **문단**: {type_counts['paragraph'] + type_counts['text']}개",
+        f"- **코드 블록**: {type_counts['code']}개",
+        f"- **테이블**: {type_counts['table']}개",
+        f"- **리스트**: {type_counts['list']}개",
         "",
         "**✅ 개선된 텍스트 추출**: 누락된 텍스트를 모두 포함하여 완전히 추출했습니다.",
         "",
-        f"*생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*"
+        f"*생성 시간: {now.strftime('%Y-%m-%d %H:%M:%S')}*"
     ])
     
     return markdown_lines, type_counts
@@ -264,16 +314,19 @@ def main():
     print("=" * 50)
     
     try:
-        # JSON 로드
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # JSON 로드 - orjson이 있으면 C 파서로 바이트를 바로 파싱
+        if orjson is not None:
+            data = orjson.loads(Path(input_file).read_bytes())
+        else:
+            with open(input_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         
         if isinstance(data, list):
             data = data[0]
         
         # HTML 파싱
         html_content = data['raw_content']['full_html']
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = parse_html(html_content)
         
         print(f"📄 HTML 크기: {len(html_content):,}자")
         
@@ -296,17 +349,15 @@ def main():
         print("📝 마크다운 변환 중...")
         markdown_lines, type_counts = convert_to_markdown(content_items, data['metadata'])
         
-        # 파일 저장
-        output_path = Path(output_file)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(markdown_lines))
+        # 파일 저장 - 한 번에 UTF-8로 인코딩해 바이트로 기록
+        md_size = Path(output_file).write_bytes('\n'.join(markdown_lines).encode('utf-8'))
         
         # 결과 출력
         print("=" * 50)
         print("🎉 개선된 변환 완료!")
         print(f"📁 출력: {output_file}")
         print(f"📊 줄 수: {len(markdown_lines):,}")
-        print(f"📏 크기: {output_path.stat().st_size:,} bytes")
+        print(f"📏 크기: {md_size:,} bytes")
         print()
         print("📋 추출 요소:")
         for content_type, count in type_counts.items():
@@ -9,6 +9,7 @@ import sys
 import json
 from pathlib import Path
 from crawlee.playwright_crawler import PlaywrightCrawler
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 
 async def scrape_webpage(url: str, output_name: str = "scraped_result"):
@@ -28,13 +29,17 @@ async def scrape_webpage(url: str, output_name: str = "scraped_result"):
         await context.page.wait_for_load_state('load')
         await context.page.wait_for_load_state('domcontentloaded')
         
-        # 메인 콘텐츠 로딩 대기
+        # 메인 콘텐츠 로딩 대기 - 대부분 DOMContentLoaded 시점에 이미 존재
         try:
-            await context.page.wait_for_selector('main, .content, .document, article', timeout=5000)
-        except:
+            await context.page.wait_for_selector('main, .content, .document, article', timeout=2000)
+        except PlaywrightTimeoutError:
             pass
         
-        await context.page.wait_for_timeout(3000)
+        # 고정 대기 대신 네트워크가 잠잠해질 때까지만 대기 (최대 5초)
+        try:
+            await context.page.wait_for_load_state('networkidle', timeout=5000)
+        except PlaywrightTimeoutError:
+            pass
         
         # 전체 HTML 추출
         full_html = await context.page.content()
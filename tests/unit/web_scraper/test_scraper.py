@@ -0,0 +1,207 @@
+# ruff: noqa: ARG002
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import pytest
+
+from web_scraper import scraper as scraper_module
+from web_scraper.scraper import WebScraper
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from crawlee import Request
+
+
+class FakePage:
+    def __init__(self, url: str) -> None:
+        self.url = url
+
+    async def wait_for_load_state(self, *args: Any, **kwargs: Any) -> None:
+        await asyncio.sleep(0)
+
+    async def wait_for_selector(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    async def content(self) -> str:
+        return f'<html><body>{self.url}</body></html>'
+
+    async def title(self) -> str:
+        return f'title {self.url}'
+
+
+class FakeContext:
+    def __init__(self, request: Request) -> None:
+        self.request = request
+        self.page = FakePage(request.url)
+
+
+class FakeRouter:
+    def __init__(self) -> None:
+        self.handler: Callable[[FakeContext], Awaitable[None]] | None = None
+
+    def default_handler(self, handler: Callable[[FakeContext], Awaitable[None]]) -> Callable:
+        self.handler = handler
+        return handler
+
+
+class FakeRequestQueue:
+    opened: ClassVar[list[FakeRequestQueue]] = []
+
+    def __init__(self, name: str | None) -> None:
+        self.name = name
+        self.dropped = False
+
+    @classmethod
+    async def open(cls, *, name: str | None = None) -> FakeRequestQueue:
+        queue = cls(name)
+        cls.opened.append(queue)
+        return queue
+
+    async def drop(self) -> None:
+        self.dropped = True
+
+
+class FakeCrawler:
+    """keep_alive 모드의 PlaywrightCrawler처럼 stop()이 불릴 때까지 큐의 요청을 처리"""
+
+    created: ClassVar[list[FakeCrawler]] = []
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.kwargs = kwargs
+        self.router = FakeRouter()
+        self.failed_handler: Callable[[FakeContext, Exception], Awaitable[None]] | None = None
+        self.queue: asyncio.Queue[Request] = asyncio.Queue()
+        self.stop_calls = 0
+        self.fail_run = False
+        FakeCrawler.created.append(self)
+
+    def failed_request_handler(self, handler: Callable[[FakeContext, Exception], Awaitable[None]]) -> Callable:
+        self.failed_handler = handler
+        return handler
+
+    async def add_requests(self, requests: list[Request]) -> None:
+        for request in requests:
+            self.queue.put_nowait(request)
+
+    def stop(self, reason: str = '') -> None:
+        self.stop_calls += 1
+
+    async def run(self) -> None:
+        assert self.router.handler is not None
+        assert self.failed_handler is not None
+
+        while not self.stop_calls:
+            if self.fail_run:
+                raise RuntimeError('browser launch failed')
+            try:
+                request = self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                await asyncio.sleep(0.001)
+                continue
+
+            if 'fail' in request.url:
+                await self.failed_handler(FakeContext(request), RuntimeError('boom'))
+            else:
+                await self.router.handler(FakeContext(request))
+
+
+@pytest.fixture(autouse=True)
+def fake_crawlee(monkeypatch: pytest.MonkeyPatch) -> None:
+    FakeCrawler.created = []
+    FakeRequestQueue.opened = []
+    monkeypatch.setattr(scraper_module, 'PlaywrightCrawler', FakeCrawler)
+    monkeypatch.setattr(scraper_module, 'RequestQueue', FakeRequestQueue)
+
+
+def _urls(results: list[dict]) -> list[str | None]:
+    return [result.get('metadata', {}).get('url') for result in results]
+
+
+async def test_scrape_without_context_uses_temporary_crawler() -> None:
+    scraper = WebScraper()
+
+    result = await scraper.scrape('https://example.com/a')
+
+    assert result['metadata']['url'] == 'https://example.com/a'
+    assert result['raw_content']['full_html'] == '<html><body>https://example.com/a</body></html>'
+    assert scraper.scraped_data is result
+
+    assert len(FakeCrawler.created) == 1
+    assert FakeCrawler.created[0].stop_calls == 1
+    assert FakeCrawler.created[0].kwargs['request_manager'] is FakeRequestQueue.opened[0]
+    assert FakeRequestQueue.opened[0].dropped
+
+
+async def test_concurrent_calls_without_context_do_not_share_crawler() -> None:
+    scraper = WebScraper()
+
+    first, second = await asyncio.gather(
+        scraper.scrape('https://example.com/a'),
+        scraper.scrape('https://example.com/b'),
+    )
+
+    assert first['metadata']['url'] == 'https://example.com/a'
+    assert second['metadata']['url'] == 'https://example.com/b'
+
+    # 호출마다 전용 크롤러와 요청 큐를 쓰고, 각자 자기 크롤러만 멈춘다
+    assert len(FakeCrawler.created) == 2
+    assert [crawler.stop_calls for crawler in FakeCrawler.created] == [1, 1]
+    assert len({queue.name for queue in FakeRequestQueue.opened}) == 2
+    assert all(queue.dropped for queue in FakeRequestQueue.opened)
+
+
+async def test_context_reuses_one_crawler() -> None:
+    async with WebScraper() as scraper:
+        results = await scraper.scrape_many(
+            ['https://example.com/a', 'https://fail.example.com', 'https://example.com/a']
+        )
+        single = await scraper.scrape('https://example.com/b')
+
+        assert len(FakeCrawler.created) == 1
+        assert FakeCrawler.created[0].stop_calls == 0
+
+    # 실패한 URL은 빈 결과, 중복 URL도 각각 결과를 받는다
+    assert _urls(results) == ['https://example.com/a', None, 'https://example.com/a']
+    assert single['metadata']['url'] == 'https://example.com/b'
+
+    assert FakeCrawler.created[0].stop_calls == 1
+    assert FakeRequestQueue.opened[0].dropped
+
+
+async def test_nested_context_stops_crawler_on_last_exit() -> None:
+    scraper = WebScraper()
+
+    async with scraper:
+        async with scraper:
+            pass
+
+        crawler = FakeCrawler.created[0]
+        assert crawler.stop_calls == 0
+        assert (await scraper.scrape('https://example.com/a'))['metadata']['url'] == 'https://example.com/a'
+
+    assert len(FakeCrawler.created) == 1
+    assert crawler.stop_calls == 1
+
+
+async def test_exit_without_enter_raises() -> None:
+    scraper = WebScraper()
+
+    with pytest.raises(RuntimeError):
+        await scraper.__aexit__(None, None, None)
+
+
+async def test_crawler_failure_returns_empty_results() -> None:
+    scraper = WebScraper()
+    await scraper.__aenter__()
+    FakeCrawler.created[0].fail_run = True
+
+    results = await scraper.scrape_many(['https://example.com/a', 'https://example.com/b'])
+
+    assert results == [{}, {}]
+
+    with pytest.raises(RuntimeError, match='browser launch failed'):
+        await scraper.__aexit__(None, None, None)
+    assert FakeRequestQueue.opened[0].dropped
@@ -2,6 +2,6 @@
 
 from .scraper import WebScraper
 from .converter import MarkdownConverter
-from .utils import clean_text, clean_code_text, generate_filename
+from .utils import clean_text, clean_code_text, generate_output_paths
 
-__all__ = ['WebScraper', 'MarkdownConverter', 'clean_text', 'clean_code_text', 'generate_filename']
\ No newline at end of file
+__all__ = ['WebScraper', 'MarkdownConverter', 'clean_text', 'clean_code_text', 'generate_output_paths']
\ No newline at end of file
@@ -1,41 +1,92 @@
 """마크다운 변환 모듈"""
 
 import re
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime
-from bs4 import BeautifulSoup, NavigableString, Tag
+from bs4 import (
+    BeautifulSoup,
+    CData,
+    Comment,
+    Declaration,
+    Doctype,
+    FeatureNotFound,
+    NavigableString,
+    ProcessingInstruction,
+    SoupStrainer,
+    Tag,
+)
 from .utils import clean_text, clean_code_text
 
 
+# 메인 콘텐츠 영역만 파싱하기 위한 필터 (nav, header, footer 등은 객체로 만들지 않음)
+# 파싱 시점의 class 속성은 분리되지 않은 문자열이므로 공백 단위로 'document'를 찾음
+_DOCUMENT_STRAINER = SoupStrainer('div', class_=re.compile(r'(?:^|\s)document(?:\s|$)'))
+# 원본 HTML에 'document' 클래스가 있는지 파싱 전에 확인하는 패턴
+# (스크립트의 document.* 참조는 걸러 내고, 없는 페이지에서 필터 파싱을 헛되이 하지 않음)
+_DOCUMENT_CLASS_RE = re.compile(r'''class\s*=\s*["']?(?:[^"'>]*\s)?document(?:[\s"'>]|$)''', re.IGNORECASE)
+
+# 코드 블록 언어 추정용 키워드 - 소문자 사본 없이 한 번의 스캔으로 검색
+_JS_HINT_RE = re.compile(r'var|function|script|eformsign', re.IGNORECASE)
+
+# 본문 텍스트로 취급하지 않는 문자열 노드 타입 (주석, CDATA, 문서 선언 등)
+_IGNORED_STRING_TYPES = frozenset({Comment, CData, Declaration, Doctype, ProcessingInstruction})
+
+
 class MarkdownConverter:
     """HTML을 마크다운으로 변환하는 클래스"""
     
-    def __init__(self):
+    def __init__(self) -> None:
         """초기화"""
         self.content_items: List[Dict[str, Any]] = []
-        self.markdown_lines: List[str] = []
     
-    def convert(self, scraped_data: Dict) -> str:
+    def convert(self, scraped_data: Dict, soup: Optional[BeautifulSoup] = None) -> str:
         """스크래핑된 데이터를 마크다운으로 변환
         
         Args:
             scraped_data: 스크래핑된 데이터 딕셔너리
+            soup: 이미 파싱된 HTML (지정하면 다시 파싱하지 않음)
             
         Returns:
             마크다운 문자열
         """
+        return ''.join(self.iter_markdown(scraped_data, soup))
+    
+    def iter_markdown(self, scraped_data: Dict, soup: Optional[BeautifulSoup] = None) -> Iterator[str]:
+        """스크래핑된 데이터를 마크다운 줄 단위로 변환
+        
+        문서 전체를 하나의 문자열로 만들지 않고 줄마다 생성하므로
+        파일에 바로 writelines로 기록할 수 있다.
+        
+        Args:
+            scraped_data: 스크래핑된 데이터 딕셔너리
+            soup: 이미 파싱된 HTML (지정하면 다시 파싱하지 않음)
+            
+        Returns:
+            줄바꿈이 붙은 마크다운 줄 이터레이터 (메인 영역이 없으면 빈 이터레이터)
+        """
         print("🔄 마크다운 변환 중...")
         
-        # HTML 파싱
-        html_content = scraped_data['raw_content']['full_html']
-        soup = BeautifulSoup(html_content, 'html.parser')
+        if soup is None:
+            # HTML 파싱 - 메인 콘텐츠(div.document) 하위 트리만 객체로 생성
+            html_content = scraped_data['raw_content']['full_html']
+            if _DOCUMENT_CLASS_RE.search(html_content):
+                soup = self._parse_html(html_content, parse_only=_DOCUMENT_STRAINER)
+            if soup is None or not soup.find('div', class_='document'):
+                # div.document가 없는 페이지는 전체를 파싱
+                soup = self._parse_html(html_content)
         
-        # 메인 콘텐츠 영역 찾기
-        main_area = soup.find('div', class_='document') or soup.find('main') or soup.find('article') or soup.find('body')
+        # div.document > main > article > body 순서로 탐색
+        main_area = (
+            soup.find('div', class_='document')
+            or soup.find('main')
+            or soup.find('article')
+            or soup.find('body')
+        )
         
         if not main_area:
             print("❌ 메인 콘텐츠 영역을 찾을 수 없습니다.")
-            return ""
+            return
         
         print(f"✅ 메인 영역 발견: {main_area.name}")
         
@@ -44,141 +95,200 @@ class MarkdownConverter:
         print(f"📊 {len(self.content_items)}개 요소 추출 완료")
         
         # 마크다운 생성
-        self._create_markdown(scraped_data['metadata'])
+        yield from self._iter_markdown(scraped_data['metadata'])
+    
+    def _parse_html(self, html_content: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """HTML 파싱 - C 기반 lxml 파서 우선 사용
         
-        return '\n'.join(self.markdown_lines)
+        Args:
+            html_content: 파싱할 HTML 문자열
+            parse_only: 지정하면 조건에 맞는 하위 트리만 객체로 생성
+            
+        Returns:
+            파싱된 BeautifulSoup 객체 (lxml이 없으면 html.parser 사용)
+        """
+        try:
+            return BeautifulSoup(html_content, 'lxml', parse_only=parse_only)
+        except FeatureNotFound:
+            return BeautifulSoup(html_content, 'html.parser', parse_only=parse_only)
     
-    def _process_inline_elements(self, element):
+    def _process_inline_elements(self, element: Tag) -> str:
         """문단 내 인라인 요소들을 마크다운으로 변환"""
-        result = ""
+        # 텍스트 노드 하나뿐인 문단은 자식 순회와 결과 재정리 없이 한 번만 정리
+        # 노드 타입은 isinstance 대신 type() 동일성으로 비교 (MRO 탐색 생략)
+        # 비교 결과로 타입이 좁혀지지 않으므로 자식 노드는 Any로 다룸
+        children: List[Any] = element.contents
+        if len(children) == 1 and type(children[0]) is NavigableString:
+            return clean_text(str(children[0]))
+        
+        parts = []
+        ignored_types = _IGNORED_STRING_TYPES
         
-        for child in element.children:
-            if isinstance(child, NavigableString):
-                result += clean_text(str(child))
-            elif isinstance(child, Tag):
+        for child in children:
+            child_type = type(child)
+            if child_type is Tag:
                 tag_name = child.name.lower()
                 text = clean_text(child.get_text())
                 
                 if tag_name in ['strong', 'b']:
-                    result += f"**{text}**"
+                    parts.append(f"**{text}**")
                 elif tag_name in ['em', 'i']:
-                    result += f"*{text}*"
+                    parts.append(f"*{text}*")
                 elif tag_name == 'code':
-                    result += f"`{text}`"
+                    parts.append(f"`{text}`")
                 else:
-                    result += text
+                    parts.append(text)
+            elif child_type not in ignored_types:
+                parts.append(clean_text(str(child)))
+        
+        return clean_text(''.join(parts))
+    
+    def _emit_heading(self, elem: Tag, tag_name: str, content_items: List[Dict[str, Any]]) -> None:
+        """헤딩 처리"""
+        text = clean_text(elem.get_text())
+        if text:
+            content_items.append({
+                'type': 'heading',
+                'level': int(tag_name[1]),
+                'content': text,
+                'tag': tag_name
+            })
+    
+    def _emit_table(self, elem: Tag, tag_name: str, content_items: List[Dict[str, Any]]) -> None:
+        """테이블 처리"""
+        table_data = self._extract_table_data(elem)
+        if table_data:
+            content_items.append({
+                'type': 'table',
+                'content': table_data
+            })
+    
+    def _emit_list(self, elem: Tag, tag_name: str, content_items: List[Dict[str, Any]]) -> None:
+        """리스트 처리"""
+        list_items = self._extract_list_items(elem)
+        if list_items:
+            content_items.append({
+                'type': 'list',
+                'content': list_items,
+                'ordered': tag_name == 'ol'
+            })
+    
+    def _emit_code(self, elem: Tag, tag_name: str, content_items: List[Dict[str, Any]]) -> None:
+        """코드 블록 처리"""
+        # pre 안의 code는 텍스트를 구하기 전에 건너뛰기
+        if tag_name == 'code' and elem.parent and elem.parent.name == 'pre':
+            return
         
-        return clean_text(result)
+        text = clean_code_text(elem.get_text())  # 코드 전용 정리 함수 사용
+        if text and len(text) > 5:
+            language = 'javascript' if _JS_HINT_RE.search(text) else 'text'
+            content_items.append({
+                'type': 'code',
+                'content': text,
+                'language': language
+            })
     
-    def _extract_all_text_content(self, element) -> List[Dict[str, Any]]:
-        """요소에서 모든 텍스트 콘텐츠를 순차적으로 추출"""
-        content_items = []
+    def _emit_bold(self, elem: Tag, tag_name: str, content_items: List[Dict[str, Any]]) -> None:
+        """Strong/Bold 텍스트 처리"""
+        text = clean_text(elem.get_text())
+        if text and len(text) > 1:
+            content_items.append({
+                'type': 'bold',
+                'content': text
+            })
+    
+    def _emit_italic(self, elem: Tag, tag_name: str, content_items: List[Dict[str, Any]]) -> None:
+        """Emphasis/Italic 텍스트 처리"""
+        text = clean_text(elem.get_text())
+        if text and len(text) > 1:
+            content_items.append({
+                'type': 'italic',
+                'content': text
+            })
+    
+    def _emit_paragraph(self, elem: Tag, tag_name: str, content_items: List[Dict[str, Any]]) -> None:
+        """문단 처리 (인라인 마크다운 지원)"""
+        markdown_text = self._process_inline_elements(elem)
+        if markdown_text and len(markdown_text) > 1:
+            content_items.append({
+                'type': 'paragraph',
+                'content': markdown_text
+            })
+    
+    # 태그별 처리 메서드 - 처리된 요소의 자식은 순회하지 않음
+    _BLOCK_HANDLERS = {
+        'h1': _emit_heading,
+        'h2': _emit_heading,
+        'h3': _emit_heading,
+        'h4': _emit_heading,
+        'h5': _emit_heading,
+        'h6': _emit_heading,
+        'table': _emit_table,
+        'ul': _emit_list,
+        'ol': _emit_list,
+        'pre': _emit_code,
+        'code': _emit_code,
+        'strong': _emit_bold,
+        'b': _emit_bold,
+        'em': _emit_italic,
+        'i': _emit_italic,
+        'p': _emit_paragraph,
+    }
+    
+    # 스킵할 요소들 - 스택에 넣지 않아 하위 트리 전체를 순회하지 않음
+    _SKIP_TAGS = frozenset({'script', 'style', 'noscript', 'nav', 'header', 'footer'})
+    
+    def _extract_all_text_content(self, element: Tag) -> List[Dict[str, Any]]:
+        """요소에서 모든 텍스트 콘텐츠를 순차적으로 추출
+        
+        재귀 호출 대신 명시적 스택으로 문서 순서대로 순회한다.
+        """
+        content_items: List[Dict[str, Any]] = []
+        # Tag와 문자열 노드가 섞이고 type() 비교로는 타입이 좁혀지지 않으므로 노드는 Any로 다룸
+        stack: List[Tuple[Any, int]] = [(element, 0)]
+        
+        # 루프마다 반복되는 속성 조회를 지역 변수로 고정
+        pop = stack.pop
+        push_children = stack.extend
+        get_handler = self._BLOCK_HANDLERS.get
+        skip_tags = self._SKIP_TAGS
+        ignored_types = _IGNORED_STRING_TYPES
         
-        def process_element(elem, level=0):
-            if isinstance(elem, NavigableString):
-                text = clean_text(str(elem))
-                if text and len(text) > 2:
-                    content_items.append({
-                        'type': 'text',
-                        'content': text,
-                        'level': level
-                    })
-                    return
+        while stack:
+            elem, level = pop()
+            
+            # 노드 타입은 isinstance 대신 type() 동일성으로 비교 (MRO 탐색 생략)
+            elem_type = type(elem)
             
-            if isinstance(elem, Tag):
+            if elem_type is Tag:
                 tag_name = elem.name.lower()
                 
-                # 헤딩 처리
-                if tag_name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                    text = clean_text(elem.get_text())
-                    if text:
-                        content_items.append({
-                            'type': 'heading',
-                            'level': int(tag_name[1]),
-                            'content': text,
-                            'tag': tag_name
-                        })
-                    return
-                
-                # 테이블 처리
-                elif tag_name == 'table':
-                    table_data = self._extract_table_data(elem)
-                    if table_data:
-                        content_items.append({
-                            'type': 'table',
-                            'content': table_data
-                        })
-                    return
-                
-                # 리스트 처리
-                elif tag_name in ['ul', 'ol']:
-                    list_items = self._extract_list_items(elem)
-                    if list_items:
-                        content_items.append({
-                            'type': 'list',
-                            'content': list_items,
-                            'ordered': tag_name == 'ol'
-                        })
-                    return
-                
-                # 코드 블록 처리
-                elif tag_name in ['pre', 'code']:
-                    text = clean_code_text(elem.get_text())  # 코드 전용 정리 함수 사용
-                    if text and len(text) > 5:
-                        # pre 안의 code는 건너뛰기
-                        if tag_name == 'code' and elem.parent and elem.parent.name == 'pre':
-                            return
-                        
-                        language = 'javascript' if any(kw in text.lower() for kw in ['var', 'function', 'script', 'eformsign']) else 'text'
-                        content_items.append({
-                            'type': 'code',
-                            'content': text,
-                            'language': language
-                        })
-                    return
+                handler = get_handler(tag_name)
+                if handler:
+                    handler(self, elem, tag_name, content_items)
+                    continue
                 
-                # Strong/Bold 텍스트 처리
-                elif tag_name in ['strong', 'b']:
-                    text = clean_text(elem.get_text())
-                    if text and len(text) > 1:
-                        content_items.append({
-                            'type': 'bold',
-                            'content': text
-                        })
-                    return
-                
-                # Emphasis/Italic 텍스트 처리
-                elif tag_name in ['em', 'i']:
-                    text = clean_text(elem.get_text())
-                    if text and len(text) > 1:
-                        content_items.append({
-                            'type': 'italic',
-                            'content': text
-                        })
-                    return
-                
-                # 문단 처리 (인라인 마크다운 지원)
-                elif tag_name == 'p':
-                    markdown_text = self._process_inline_elements(elem)
-                    if markdown_text and len(markdown_text) > 1:
-                        content_items.append({
-                            'type': 'paragraph',
-                            'content': markdown_text
-                        })
-                    return
-                
-                # 스킵할 요소들
-                elif tag_name in ['script', 'style', 'nav', 'header', 'footer']:
-                    return
-                
-                # 다른 모든 요소들의 자식을 재귀적으로 처리
-                for child in elem.children:
-                    process_element(child, level + 1)
+                # 다른 모든 요소들의 자식은 문서 순서를 유지하도록 역순으로 스택에 추가
+                # (스킵 태그는 꺼낸 뒤 버리지 않고 처음부터 넣지 않음, 텍스트 노드의 name은 None)
+                child_level = level + 1
+                push_children((child, child_level) for child in reversed(elem.contents) if child.name not in skip_tags)
+                continue
+            
+            # 주석·CDATA 등은 본문 텍스트가 아니므로 건너뛰기
+            if elem_type in ignored_types:
+                continue
+            
+            text = clean_text(str(elem))
+            if text and len(text) > 2:
+                content_items.append({
+                    'type': 'text',
+                    'content': text,
+                    'level': level
+                })
         
-        process_element(element)
         return content_items
     
-    def _extract_table_data(self, table_element) -> Optional[Dict[str, Any]]:
+    def _extract_table_data(self, table_element: Tag) -> Optional[Dict[str, Any]]:
         """테이블 데이터 추출"""
         rows = []
         headers = []
@@ -198,7 +308,7 @@ class MarkdownConverter:
         
         return {'headers': headers, 'rows': rows} if rows else None
     
-    def _extract_list_items(self, list_element) -> Optional[List[str]]:
+    def _extract_list_items(self, list_element: Tag) -> Optional[List[str]]:
         """리스트 아이템 추출"""
         items = []
         list_items = list_element.find_all('li', recursive=False)
@@ -210,114 +320,94 @@ class MarkdownConverter:
         
         return items if items else None
     
-    def _create_markdown(self, metadata: Dict[str, Any]):
-        """마크다운 생성"""
-        self.markdown_lines = []
+    def _iter_markdown(self, metadata: Dict[str, Any]) -> Iterator[str]:
+        """마크다운 생성 - 줄마다 줄바꿈을 붙여 순서대로 반환 (마지막 줄 제외)"""
+        # 생성 시각은 한 번만 구해 헤더와 푸터에서 함께 사용
+        now = datetime.now()
         
         # 문서 헤더
         title = metadata['page_title'] or "웹페이지 가이드"
-        self.markdown_lines.extend([
-            f"# {title}",
-            "",
-            f"> **자동 생성된 가이드 문서**",
-            "",
-            f"**출처**: {metadata['url']}",
-            f"**제목**: {metadata['page_title']}",
-            f"**생성일**: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-            "",
-            "---",
-            ""
-        ])
+        yield f"# {title}\n"
+        yield "\n"
+        yield f"> **자동 생성된 가이드 문서**\n"
+        yield "\n"
+        yield f"**출처**: {metadata['url']}\n"
+        yield f"**제목**: {metadata['page_title']}\n"
+        yield f"**생성일**: {now.strftime('%Y-%m-%d %H:%M')}\n"
+        yield "\n"
+        yield "---\n"
+        yield "\n"
         
-        # 콘텐츠 변환
+        # 콘텐츠 변환 - 유형별 개수도 같은 순회에서 집계
+        type_counts: Counter[str] = Counter()
         for item in self.content_items:
             item_type = item['type']
+            type_counts[item_type] += 1
             
             if item_type == 'heading':
                 level = item['level']
                 content = item['content']
                 prefix = '#' * level
-                self.markdown_lines.extend([
-                    f"{prefix} {content}",
-                    ""
-                ])
+                yield f"{prefix} {content}\n"
+                yield "\n"
             
             elif item_type == 'paragraph' or item_type == 'text':
-                self.markdown_lines.extend([
-                    item['content'],
-                    ""
-                ])
+                yield f"{item['content']}\n"
+                yield "\n"
             
             elif item_type == 'code':
                 language = item.get('language', 'text')
-                self.markdown_lines.extend([
-                    f"```{language}",
-                    item['content'],
-                    "```",
-                    ""
-                ])
+                yield f"```{language}\n"
+                yield f"{item['content']}\n"
+                yield "```\n"
+                yield "\n"
             
             elif item_type == 'table':
                 table_data = item['content']
+                headers = table_data['headers']
                 
-                # 헤더가 있으면 헤더부터
-                if table_data['headers']:
-                    header_row = '| ' + ' | '.join(table_data['headers']) + ' |'
-                    separator = '|' + '---|' * len(table_data['headers'])
-                    self.markdown_lines.extend([header_row, separator])
+                # 헤더가 있으면 헤더부터 - 표 전체를 한 덩어리로 만들어 한 번에 반환
+                table_lines = ['| ' + ' | '.join(headers) + ' |', '|' + '---|' * len(headers)] if headers else []
                 
                 # 데이터 행들
-                for row in table_data['rows']:
-                    if row:
-                        row_text = '| ' + ' | '.join(str(cell) for cell in row) + ' |'
-                        self.markdown_lines.append(row_text)
+                table_lines.extend('| ' + ' | '.join(map(str, row)) + ' |' for row in table_data['rows'] if row)
+                table_lines.append("")
                 
-                self.markdown_lines.append("")
+                yield '\n'.join(table_lines) + '\n'
             
             elif item_type == 'bold':
-                self.markdown_lines.extend([
-                    f"**{item['content']}**",
-                    ""
-                ])
+                yield f"**{item['content']}**\n"
+                yield "\n"
             
             elif item_type == 'italic':
-                self.markdown_lines.extend([
-                    f"*{item['content']}*",
-                    ""
-                ])
+                yield f"*{item['content']}*\n"
+                yield "\n"
             
             elif item_type == 'list':
                 items = item['content']
-                ordered = item.get('ordered', False)
                 
-                for i, list_item in enumerate(items, 1):
-                    if ordered:
-                        self.markdown_lines.append(f"{i}. {list_item}")
-                    else:
-                        self.markdown_lines.append(f"- {list_item}")
+                # 리스트 전체를 한 덩어리로 만들어 한 번에 반환
+                if item.get('ordered', False):
+                    list_lines = [f"{i}. {list_item}\n" for i, list_item in enumerate(items, 1)]
+                else:
+                    list_lines = [f"- {list_item}\n" for list_item in items]
+                list_lines.append("\n")
                 
-                self.markdown_lines.append("")
+                yield ''.join(list_lines)
         
         # 통계 정보
-        type_counts = {}
-        for item in self.content_items:
-            t = item['type']
-            type_counts[t] = type_counts.get(t, 0) + 1
-        
-        self.markdown_lines.extend([
-            "---",
-            "",
-            "## 📊 문서 정보",
-            "",
-            f"- **추출된 총 요소**: {len(self.content_items)}개",
-            f"- **헤딩**: {type_counts.get('heading', 0)}개",
-            f"- **문단**: {type_counts.get('paragraph', 0) + type_counts.get('text', 0)}개",
-            f"- **코드 블록**: {type_counts.get('code', 0)}개",
-            f"- **테이블**: {type_counts.get('table', 0)}개",
-            f"- **리스트**: {type_counts.get('list', 0)}개",
-            "",
-            "**✅ 자동 생성 완료**: 웹페이지를 완전히 마크다운으로 변환했습니다.",
-            "",
-            f"*생성 도구: web_scraper 모듈*",
-            f"*생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*"
-        ])
\ No newline at end of file
+        yield "---\n"
+        yield "\n"
+        yield "## 📊 문서 정보\n"
+        yield "\n"
+        yield f"- **추출된 총 요소**: {len(self.content_items)}개\n"
+        yield f"- **헤딩**: {type_counts['heading']}개\n"
+        yield f"- **문단**: {type_counts['paragraph'] + type_counts['text']}개\n"
+        yield f"- **코드 블록**: {type_counts['code']}개\n"
+        yield f"- **테이블**: {type_counts['table']}개\n"
+        yield f"- **리스트**: {type_counts['list']}개\n"
+        yield "\n"
+        yield "**✅ 자동 생성 완료**: 웹페이지를 완전히 마크다운으로 변환했습니다.\n"
+        yield "\n"
+        yield f"*생성 도구: web_scraper 모듈*\n"
+        yield f"*생성 시간: {now.strftime('%Y-%m-%d %H:%M:%S')}*"
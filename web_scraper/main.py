@@ -1,12 +1,18 @@
 """웹 스크래퍼 메인 실행 파일"""
 
 import asyncio
+import json
 import sys
 from pathlib import Path
 from .scraper import WebScraper
 from .converter import MarkdownConverter
 from .utils import generate_output_paths
 
+try:
+    import orjson  # C 기반 JSON 직렬화 (선택 의존성)
+except ImportError:
+    orjson = None
+
 
 async def main():
     """메인 함수"""
@@ -30,9 +36,9 @@ async def main():
         print("🚀 웹페이지 스크래핑 & 마크다운 변환 시작")
         print("=" * 60)
         
-        # 1단계: 스크래핑
-        scraper = WebScraper()
-        scraped_data = await scraper.scrape(url)
+        # 1단계: 스크래핑 - 블록을 벗어나면 브라우저 정리
+        async with WebScraper() as scraper:
+            scraped_data = await scraper.scrape(url)
         
         if not scraped_data:
             print("❌ 스크래핑 실패")
@@ -40,11 +46,12 @@ async def main():
         
         print("✅ 스크래핑 완료")
         
-        # 2단계: 마크다운 변환
+        # 2단계: 마크다운 변환 - 줄 단위로 생성해 문서 전체를 메모리에 들고 있지 않음
         converter = MarkdownConverter()
-        markdown_content = converter.convert(scraped_data)
+        markdown_lines = converter.iter_markdown(scraped_data)
+        first_line = next(markdown_lines, None)
         
-        if not markdown_content:
+        if first_line is None:
             print("❌ 마크다운 변환 실패")
             return
         
@@ -53,25 +60,42 @@ async def main():
         # 3단계: 파일 저장
         folder_path, markdown_path, json_path = generate_output_paths(url)
         
-        # 마크다운 파일 저장
-        with open(markdown_path, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
+        # 마크다운 파일 저장 - 생성되는 줄을 바로 기록하며 줄 수와 바이트 수 집계
+        line_count = first_line.count('\n') + 1
+        with open(markdown_path, 'wb') as f:
+            md_size = f.write(first_line.encode('utf-8'))
+            for line in markdown_lines:
+                md_size += f.write(line.encode('utf-8'))
+                line_count += line.count('\n')
         
-        # JSON 파일 저장
-        import json
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(scraped_data, f, ensure_ascii=False, indent=2)
+        # 원본 HTML은 별도 파일로 저장 (JSON에 다시 인코딩하지 않음)
+        html_path = Path(json_path).with_suffix('.html')
+        raw_content = scraped_data['raw_content']
+        with open(html_path, 'wb') as f:
+            html_size = f.write(raw_content['full_html'].encode('utf-8'))
         
-        # 파일 정보 수집
-        md_size = Path(markdown_path).stat().st_size
-        json_size = Path(json_path).stat().st_size
-        line_count = len(markdown_content.split('\n'))
+        # JSON 파일 저장 - full_html 대신 HTML 파일 이름만 기록
+        json_data = {
+            **scraped_data,
+            'raw_content': {
+                **{key: value for key, value in raw_content.items() if key != 'full_html'},
+                'html_file': html_path.name,
+            },
+        }
+        # orjson이 있으면 UTF-8 바이트로 바로 직렬화
+        if orjson is not None:
+            json_bytes = orjson.dumps(json_data, option=orjson.OPT_INDENT_2)
+        else:
+            json_bytes = json.dumps(json_data, ensure_ascii=False, indent=2).encode('utf-8')
+        with open(json_path, 'wb') as f:
+            json_size = f.write(json_bytes)
         
         print("=" * 60)
         print("🎉 변환 완료!")
         print(f"📁 출력 폴더: {folder_path}")
         print(f"📄 마크다운: {Path(markdown_path).name} ({md_size:,} bytes)")
         print(f"📋 JSON 데이터: {Path(json_path).name} ({json_size:,} bytes)")
+        print(f"🌐 원본 HTML: {html_path.name} ({html_size:,} bytes)")
         print(f"📊 줄 수: {line_count:,}")
         print(f"🔗 원본 URL: {url}")
         print("=" * 60)
@@ -1,15 +1,179 @@
 """웹 스크래핑 모듈"""
 
 import asyncio
-from typing import Dict, Optional
+import uuid
+from types import TracebackType
+from typing import Dict, List, Literal, Optional, Type
 from datetime import datetime
-from crawlee.crawlers import PlaywrightCrawler
+from crawlee import ConcurrencySettings, Request
+from crawlee.crawlers import BasicCrawlingContext, PlaywrightCrawler, PlaywrightCrawlingContext
+from crawlee.storages import RequestQueue
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+
+# 한 번의 크롤링에서 동시에 여는 최대 페이지 수
+MAX_CONCURRENCY = 8
+
+# PlaywrightCrawler가 지원하는 브라우저 타입
+BrowserType = Literal['chromium', 'firefox', 'webkit']
+
+
+async def _collect_page(context: PlaywrightCrawlingContext) -> Dict:
+    """페이지 로딩을 기다린 뒤 HTML과 메타데이터 수집"""
+    print("  ⏳ 페이지 로딩 중...")
+    
+    # 페이지 로딩 대기
+    await context.page.wait_for_load_state('load')
+    await context.page.wait_for_load_state('domcontentloaded')
+    
+    # 메인 콘텐츠 로딩 대기
+    try:
+        await context.page.wait_for_selector('main, .content, .document, article, .container', timeout=5000)
+        print("  ✅ 메인 콘텐츠 발견")
+    except PlaywrightTimeoutError:
+        print("  ⚠️ 메인 콘텐츠 선택자 대기 시간 초과 (계속 진행)")
+    
+    # 고정 대기 대신 네트워크가 잠잠해질 때까지만 대기 (최대 3초)
+    try:
+        await context.page.wait_for_load_state('networkidle', timeout=3000)
+    except PlaywrightTimeoutError:
+        pass
+    
+    # 전체 HTML 추출
+    full_html = await context.page.content()
+    page_title = await context.page.title()
+    
+    print(f"  📄 HTML 크기: {len(full_html):,}자")
+    print(f"  📝 페이지 제목: {page_title}")
+    
+    return {
+        'metadata': {
+            'url': str(context.request.url),
+            'page_title': page_title,
+            'timestamp': datetime.now().isoformat(),
+            'content_length': len(full_html)
+        },
+        'raw_content': {
+            'full_html': full_html,
+        }
+    }
+
+
+class _CrawlSession:
+    """백그라운드에서 계속 실행되는 크롤러 하나와 그 요청·결과를 묶은 단위
+    
+    세션마다 전용 요청 큐를 쓰고 종료할 때 큐를 삭제하므로, 처리되지 않은 요청이
+    같은 프로세스의 다른 크롤러로 넘어가지 않는다.
+    """
+    
+    def __init__(self, headless: bool, browser_type: BrowserType) -> None:
+        """초기화
+        
+        Args:
+            headless: 헤드리스 모드 여부
+            browser_type: 브라우저 타입 ('chromium', 'firefox', 'webkit')
+        """
+        self.headless = headless
+        self.browser_type = browser_type
+        
+        self._crawler: Optional[PlaywrightCrawler] = None
+        self._crawler_task: Optional[asyncio.Task] = None
+        self._request_queue: Optional[RequestQueue] = None
+        # 요청 unique_key → 결과를 기다리는 Future
+        self._pending: Dict[str, asyncio.Future] = {}
+    
+    async def start(self) -> None:
+        """전용 요청 큐를 열고 keep_alive 크롤러를 백그라운드에서 실행"""
+        self._request_queue = await RequestQueue.open(name=f'web-scraper-{uuid.uuid4().hex}')
+        
+        crawler = PlaywrightCrawler(
+            headless=self.headless,
+            browser_type=self.browser_type,
+            request_manager=self._request_queue,
+            keep_alive=True,
+            concurrency_settings=ConcurrencySettings(max_concurrency=MAX_CONCURRENCY),
+        )
+        crawler.router.default_handler(self._handle_page)
+        crawler.failed_request_handler(self._handle_failed)
+        
+        self._crawler = crawler
+        self._crawler_task = asyncio.create_task(crawler.run())
+    
+    async def close(self) -> None:
+        """크롤러를 멈추고 브라우저 정리가 끝날 때까지 대기한 뒤 요청 큐 삭제"""
+        crawler, crawler_task, request_queue = self._crawler, self._crawler_task, self._request_queue
+        if crawler is None or crawler_task is None or request_queue is None:
+            raise RuntimeError('시작되지 않은 크롤러 세션입니다.')
+        
+        crawler.stop('WebScraper 종료')
+        try:
+            await crawler_task
+        finally:
+            await request_queue.drop()
+    
+    async def scrape_many(self, urls: List[str]) -> List[Dict]:
+        """URL들을 크롤러 큐에 추가하고 모든 결과가 나올 때까지 대기
+        
+        Args:
+            urls: 스크래핑할 URL 목록
+        
+        Returns:
+            URL 순서대로 정렬된 스크래핑 데이터 목록 (실패한 URL은 빈 딕셔너리)
+        """
+        crawler, crawler_task = self._crawler, self._crawler_task
+        if crawler is None or crawler_task is None:
+            raise RuntimeError('시작되지 않은 크롤러 세션입니다.')
+        
+        for url in urls:
+            print(f"🔄 스크래핑 시작: {url}")
+        
+        # 같은 URL을 다시 요청해도 큐에서 중복 제거되지 않도록 항상 새 요청으로 추가
+        loop = asyncio.get_running_loop()
+        requests = [Request.from_url(url, always_enqueue=True) for url in urls]
+        futures = []
+        for request in requests:
+            future = loop.create_future()
+            self._pending[request.unique_key] = future
+            futures.append(future)
+        
+        try:
+            await crawler.add_requests(requests)
+            
+            # 크롤러가 도중에 종료되면 (브라우저 실행 실패 등) 남은 URL은 실패로 처리
+            all_done = asyncio.gather(*futures)
+            await asyncio.wait({all_done, crawler_task}, return_when=asyncio.FIRST_COMPLETED)
+            if not all_done.done():
+                all_done.cancel()
+        finally:
+            for request in requests:
+                self._pending.pop(request.unique_key, None)
+        
+        return [future.result() if future.done() and not future.cancelled() else {} for future in futures]
+    
+    def _resolve(self, unique_key: str, scraped_data: Dict) -> None:
+        """요청을 기다리는 호출자에게 결과 전달"""
+        future = self._pending.get(unique_key)
+        if future is not None and not future.done():
+            future.set_result(scraped_data)
+    
+    async def _handle_page(self, context: PlaywrightCrawlingContext) -> None:
+        """페이지 데이터를 수집해 요청한 호출자에게 전달"""
+        self._resolve(context.request.unique_key, await _collect_page(context))
+    
+    async def _handle_failed(self, context: BasicCrawlingContext, error: Exception) -> None:
+        """재시도를 모두 실패한 요청은 빈 결과로 처리"""
+        print(f"  ❌ 스크래핑 실패: {context.request.url} ({error})")
+        self._resolve(context.request.unique_key, {})
 
 
 class WebScraper:
-    """웹페이지 스크래핑 클래스"""
+    """웹페이지 스크래핑 클래스
+    
+    `async with WebScraper() as scraper:` 블록 안에서는 브라우저를 한 번만 띄우고
+    scrape / scrape_many 호출마다 재사용한다.
+    """
     
-    def __init__(self, headless: bool = True, browser_type: str = 'chromium'):
+    def __init__(self, headless: bool = True, browser_type: BrowserType = 'chromium') -> None:
         """초기화
         
         Args:
@@ -19,65 +183,84 @@ class WebScraper:
         self.headless = headless
         self.browser_type = browser_type
         self.scraped_data: Optional[Dict] = None
+        
+        # async with로 연 공유 세션과 그 블록에 들어가 있는 수
+        self._session: Optional[_CrawlSession] = None
+        self._session_users = 0
+        self._session_lock: Optional[asyncio.Lock] = None
+    
+    def _get_session_lock(self) -> asyncio.Lock:
+        """세션 시작·종료용 락 (Python 3.9에서는 Lock이 생성 시점의 루프에 묶이므로 처음 쓸 때 생성)"""
+        if self._session_lock is None:
+            self._session_lock = asyncio.Lock()
+        return self._session_lock
+    
+    async def __aenter__(self) -> 'WebScraper':
+        """공유 크롤러 세션 시작 - 중첩해서 들어가면 같은 세션을 함께 사용"""
+        async with self._get_session_lock():
+            if self._session is None:
+                session = _CrawlSession(self.headless, self.browser_type)
+                await session.start()
+                self._session = session
+            self._session_users += 1
+        return self
+    
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """마지막으로 블록을 나갈 때만 크롤러를 멈추고 정리"""
+        async with self._get_session_lock():
+            if self._session is None:
+                raise RuntimeError('async with 블록에 들어가지 않은 WebScraper입니다.')
+            
+            self._session_users -= 1
+            if self._session_users:
+                return
+            
+            session = self._session
+            self._session = None
+        
+        await session.close()
     
     async def scrape(self, url: str) -> Dict:
         """웹페이지 스크래핑
         
         Args:
             url: 스크래핑할 URL
-            
+        
         Returns:
             스크래핑된 데이터 딕셔너리
         """
-        print(f"🔄 스크래핑 시작: {url}")
+        results = await self.scrape_many([url])
         
-        crawler = PlaywrightCrawler(
-            headless=self.headless,
-            browser_type=self.browser_type,
-            max_requests_per_crawl=1,
-        )
-
-        scraped_data = {}
-
-        @crawler.router.default_handler
-        async def handler(context):
-            nonlocal scraped_data
-            
-            print("  ⏳ 페이지 로딩 중...")
-            
-            # 페이지 로딩 대기
-            await context.page.wait_for_load_state('load')
-            await context.page.wait_for_load_state('domcontentloaded')
-            
-            # 메인 콘텐츠 로딩 대기
-            try:
-                await context.page.wait_for_selector('main, .content, .document, article, .container', timeout=5000)
-                print("  ✅ 메인 콘텐츠 발견")
-            except:
-                print("  ⚠️ 메인 콘텐츠 선택자 대기 시간 초과 (계속 진행)")
-            
-            await context.page.wait_for_timeout(3000)
-            
-            # 전체 HTML 추출
-            full_html = await context.page.content()
-            page_title = await context.page.title()
-            
-            scraped_data = {
-                'metadata': {
-                    'url': str(context.request.url),
-                    'page_title': page_title,
-                    'timestamp': datetime.now().isoformat(),
-                    'content_length': len(full_html)
-                },
-                'raw_content': {
-                    'full_html': full_html,
-                }
-            }
-            
-            print(f"  📄 HTML 크기: {len(full_html):,}자")
-            print(f"  📝 페이지 제목: {page_title}")
-
-        await crawler.run([url])
+        self.scraped_data = results[0]
+        return self.scraped_data
+    
+    async def scrape_many(self, urls: List[str]) -> List[Dict]:
+        """여러 웹페이지를 한 번의 크롤링으로 동시에 스크래핑
+        
+        브라우저를 한 번만 띄우고 URL들을 병렬로 처리한다.
+        `async with` 블록 밖에서 호출하면 이 호출 전용 크롤러를 띄웠다가 끝나면 정리한다.
+        
+        Args:
+            urls: 스크래핑할 URL 목록
+        
+        Returns:
+            URL 순서대로 정렬된 스크래핑 데이터 목록 (실패한 URL은 빈 딕셔너리)
+        """
+        if not urls:
+            return []
+        
+        if self._session is not None:
+            return await self._session.scrape_many(urls)
         
-        self.scraped_data = scraped_data
-        return scraped_data
\ No newline at end of file
+        # 다른 호출과 크롤러를 공유하지 않도록 세션을 인스턴스에 저장하지 않음
+        session = _CrawlSession(self.headless, self.browser_type)
+        await session.start()
+        try:
+            return await session.scrape_many(urls)
+        finally:
+            await session.close()
\ No newline at end of file
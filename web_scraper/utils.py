@@ -2,6 +2,20 @@
 
 import re
 import urllib.parse
+from datetime import datetime
+from pathlib import Path
+
+
+# 보이지 않는 특수문자 - 텍스트를 한 번만 스캔하도록 하나의 문자 클래스로 합침
+_INVISIBLE_RE = re.compile(
+    r'[\u200B-\u200F\uFEFF\u2060\u00AD'  # Zero width characters, BOM, soft hyphen
+    r'\u0000-\u001F\u007F-\u009F'  # Control characters
+    r'\uE000-\uF8FF'  # Private Use Area
+    r'\uFFF0-\uFFFF]'  # Specials block
+)
+_MULTISPACE_RE = re.compile(r' +')
+# 파일명에 쓸 수 없는 문자
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\-_.]')
 
 
 def clean_text(text: str) -> str:
@@ -16,14 +30,10 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    # 보이지 않는 특수문자 제거
-    text = re.sub(r'[\u200B-\u200F\uFEFF\u2060\u00AD]', '', text)  # Zero width characters, BOM, soft hyphen
-    text = re.sub(r'[\u0000-\u001F\u007F-\u009F]', '', text)  # Control characters
-    text = re.sub(r'[\uE000-\uF8FF]', '', text)  # Private Use Area
-    text = re.sub(r'[\uFFF0-\uFFFF]', '', text)  # Specials block
+    # 보이지 않는 특수문자 제거 (탭·개행도 제어 문자 범위에 포함되어 함께 제거됨)
+    text = _INVISIBLE_RE.sub('', text)
     
-    text = text.replace('\t', ' ')
-    text = re.sub(r' +', ' ', text)  # 다중 공백을 단일로
+    text = _MULTISPACE_RE.sub(' ', text)  # 다중 공백을 단일로
     return text.strip()
 
 
@@ -54,19 +64,16 @@ def generate_output_paths(url: str, suffix: str = "_guide") -> tuple[str, str, s
     Returns:
         (폴더경로, 마크다운경로, JSON경로) 튜플
     """
-    from datetime import datetime
-    from pathlib import Path
-    
     parsed = urllib.parse.urlparse(url)
     domain = parsed.netloc.replace('www.', '')
     
     # 도메인에서 특수 문자 제거
-    clean_domain = re.sub(r'[^\w\-_.]', '_', domain)
+    clean_domain = _UNSAFE_FILENAME_RE.sub('_', domain)
     
     # 경로가 있으면 마지막 부분 추가
     if parsed.path and parsed.path != '/':
         path_part = parsed.path.strip('/').split('/')[-1]
-        path_part = re.sub(r'[^\w\-_.]', '_', path_part)
+        path_part = _UNSAFE_FILENAME_RE.sub('_', path_part)
         if path_part and len(path_part) < 20:
             clean_domain += f"_{path_part}"
     
@@ -74,12 +81,9 @@ def generate_output_paths(url: str, suffix: str = "_guide") -> tuple[str, str, s
     timestamp = datetime.now().strftime("%Y%m%d_%H%M")
     base_name = f"{clean_domain}{suffix}_{timestamp}"
     
-    # 폴더 구조 생성
-    output_dir = Path("outputs")
-    output_dir.mkdir(exist_ok=True)
-    
-    folder_path = output_dir / base_name
-    folder_path.mkdir(exist_ok=True)
+    # 폴더 구조 생성 - outputs 폴더까지 한 번에 생성
+    folder_path = Path("outputs") / base_name
+    folder_path.mkdir(parents=True, exist_ok=True)
     
     markdown_path = folder_path / f"{base_name}.md"
     json_path = folder_path / f"{base_name}.json"